@@ -0,0 +1,21 @@
+# extraction/etag.py
+import os
+
+
+def read_etag(file_path):
+    """Return the ETag saved next to file_path, or None if there is none."""
+    etag_path = file_path + ".etag"
+    if not (os.path.exists(file_path) and os.path.exists(etag_path)):
+        return None
+    with open(etag_path) as file:
+        return file.read().strip() or None
+
+
+def write_etag(file_path, etag):
+    """Save the ETag in a sidecar file next to file_path, or drop a stale one if there is none."""
+    etag_path = file_path + ".etag"
+    if etag:
+        with open(etag_path, 'w') as file:
+            file.write(etag)
+    elif os.path.exists(etag_path):
+        os.remove(etag_path)
@@ -1,15 +1,24 @@
 # extraction/fetch_data.py
 import requests
+import orjson
+from extraction.session import session, REQUEST_TIMEOUT
 
 
-def fetch_data(api_url):
-    """Fetch data from the SpaceX API."""
+def fetch_data(api_url, etag=None):
+    """Fetch data from the SpaceX API.
+
+    Returns (data, etag, modified); modified is False if the server answered 304 Not Modified.
+    """
     try:
         print(f"Fetching data from {api_url}...")
-        response = requests.get(api_url)
+        headers = {'If-None-Match': etag} if etag else {}
+        response = session.get(api_url, headers=headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 304:
+            print(f"Data at {api_url} not modified.")
+            return None, etag, False
         response.raise_for_status()
         print("Data fetched successfully.")
-        return response.json()
+        return orjson.loads(response.content), response.headers.get('ETag'), True
     except requests.exceptions.RequestException as e:
         print(f"Request failed: {e}")
         raise
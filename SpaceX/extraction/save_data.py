@@ -4,8 +4,7 @@ import json
 
 def save_data_to_file(data, save_path, name):
     """Save fetched JSON data to a file in the specified path."""
-    if not os.path.exists(save_path):
-        os.makedirs(save_path)
+    os.makedirs(save_path, exist_ok=True)  # Safe when several workers save at once
     file_path = os.path.join(save_path, f"{name}.json")
     with open(file_path, 'w') as file:
         json.dump(data, file, indent=4)
@@ -2,38 +2,58 @@
 import requests
 import os
 import json
+import orjson
 import re
+from extraction.session import session, REQUEST_TIMEOUT
 
-def fetch_schema(github_url):
-    """Fetch schema from a raw GitHub URL."""
+# Markdown fences delimiting the JSON block
+_JSON_FENCE_OPEN = "```json\n"
+_JSON_FENCE_CLOSE = "\n```"
+
+# Precompiled pattern used by extract_json_from_markdown
+_TRAILING_COMMA = re.compile(r',\s*([}\]])')
+
+def fetch_schema(github_url, etag=None):
+    """Fetch schema from a raw GitHub URL.
+
+    Returns (markdown, etag, modified); modified is False if the server answered 304 Not Modified.
+    """
     try:
         print(f"Fetching schema from {github_url}...")
-        response = requests.get(github_url)
+        headers = {'If-None-Match': etag} if etag else {}
+        response = session.get(github_url, headers=headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 304:
+            print(f"Schema at {github_url} not modified.")
+            return None, etag, False
         response.raise_for_status()  # Raise error for invalid responses
         print("Schema fetched successfully.")
-        return response.text  # Return the schema as raw markdown text
+        return response.text, response.headers.get('ETag'), True  # Return the schema as raw markdown text
     except requests.exceptions.RequestException as e:
         print(f"Request failed: {e}")
         raise
 
 def extract_json_from_markdown(markdown_text):
     """Extract and clean up JSON from markdown formatted text."""
-    # Use regular expression to find the JSON block within the markdown
-    json_match = re.search(r"```json\n(.*?)\n```", markdown_text, re.DOTALL)
-    if json_match:
-        json_str = json_match.group(1)  # Extract JSON string
+    # Find the JSON block within the markdown using plain string search
+    start = markdown_text.find(_JSON_FENCE_OPEN)
+    end = -1
+    if start != -1:
+        start += len(_JSON_FENCE_OPEN)
+        end = markdown_text.find(_JSON_FENCE_CLOSE, start)
+    if end != -1:
+        json_str = markdown_text[start:end]  # Extract JSON string
         
         # Replace any single quotes with double quotes
         json_str = json_str.replace("'", '"')
         
         # Remove trailing commas (if any)
-        json_str = re.sub(r',\s*([}\]])', r'\1', json_str)
+        json_str = _TRAILING_COMMA.sub(r'\1', json_str)
         
         try:
             # Try parsing the cleaned JSON string
-            json_data = json.loads(json_str)
+            json_data = orjson.loads(json_str)
             return json_data
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             print(f"Failed to decode JSON: {e}")
             raise
     else:
@@ -44,8 +64,7 @@ def save_schema_to_file(data, save_path, name):
 
     data = extract_json_from_markdown(data)
     """Save fetched JSON data to a file in the specified path."""
-    if not os.path.exists(save_path):
-        os.makedirs(save_path)
+    os.makedirs(save_path, exist_ok=True)  # Safe when several workers save at once
     file_path = os.path.join(save_path, f"{name}.json")
     with open(file_path, 'w') as file:
         json.dump(data, file, indent=4)
@@ -0,0 +1,14 @@
+# extraction/session.py
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+REQUEST_TIMEOUT = 10  # Seconds to wait for a response
+
+# Shared session so repeated requests reuse keep-alive connections
+session = requests.Session()
+session.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+))
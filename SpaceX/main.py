@@ -1,25 +1,67 @@
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from extraction.fetch_data import fetch_data
 from extraction.save_data import save_data_to_file
+from extraction.etag import read_etag, write_etag
 from extraction.schema import fetch_schema, save_schema_to_file
 
 SPACEX_API_URL = "https://api.spacexdata.com/v4/"
+# Seconds before a saved file is fetched again. Age is taken from the <file>.fetched
+# marker written after each fetch, not from the file itself, whose mtime is the git
+# checkout time for the committed data/schema snapshots.
+CACHE_TTL = 24 * 60 * 60
+FORCE_REFRESH = os.environ.get("SPACEX_FORCE_REFRESH") == "1"  # Set to bypass the cache
+
+def is_fresh(file_path):
+    """Return True if the file exists and was fetched less than CACHE_TTL ago."""
+    marker_path = file_path + ".fetched"
+    if FORCE_REFRESH or not (os.path.exists(file_path) and os.path.exists(marker_path)):
+        return False
+    return time.time() - os.path.getmtime(marker_path) < CACHE_TTL
+
+def mark_fetched(file_path):
+    """Record that file_path was just fetched (or confirmed unchanged)."""
+    with open(file_path + ".fetched", 'w') as file:
+        file.write(str(int(time.time())))
+
+def cached_etag(file_path):
+    """Return the ETag to send for a conditional GET, unless a refresh is forced."""
+    return None if FORCE_REFRESH else read_etag(file_path)
 
 def fetch_and_process_data(source_url, table_name):
     save_data = "data"  # Directory to save the data
     save_schema = "schema"  # Directory to save the schema
 
     try:
-        # Fetch and save the data
-        full_url = SPACEX_API_URL + source_url
-        data = fetch_data(full_url)
-        save_data_to_file(data, save_data, table_name)
+        # Fetch and save the data (skipped if a fresh copy is already on disk)
+        data_path = os.path.join(save_data, f"{table_name}.json")
+        if is_fresh(data_path):
+            print(f"Using cached data from {data_path}")
+        else:
+            full_url = SPACEX_API_URL + source_url
+            data, etag, modified = fetch_data(full_url, cached_etag(data_path))
+            if not modified:
+                print(f"Using cached data from {data_path}")  # Unchanged on the server
+            else:
+                save_data_to_file(data, save_data, table_name)
+                write_etag(data_path, etag)
+            mark_fetched(data_path)
 
         # Raw GitHub URL for schema (change this to the raw URL)
-        full_url_schema = f"https://raw.githubusercontent.com/r-spacex/SpaceX-API/master/docs/{table_name}/v4/schema.md"
-        schema = fetch_schema(full_url_schema)  # Fetch raw markdown schema
         schema_name = table_name + "_schema"  # Add '_schema' suffix to the table name
-        save_schema_to_file(schema, save_schema, schema_name)  # Save the raw markdown schema
+        schema_path = os.path.join(save_schema, f"{schema_name}.json")
+        if is_fresh(schema_path):
+            print(f"Using cached schema from {schema_path}")
+        else:
+            full_url_schema = f"https://raw.githubusercontent.com/r-spacex/SpaceX-API/master/docs/{table_name}/v4/schema.md"
+            schema, etag, modified = fetch_schema(full_url_schema, cached_etag(schema_path))  # Fetch raw markdown schema
+            if not modified:
+                print(f"Using cached schema from {schema_path}")  # Unchanged on the server
+            else:
+                save_schema_to_file(schema, save_schema, schema_name)  # Save the raw markdown schema
+                write_etag(schema_path, etag)
+            mark_fetched(schema_path)
 
     except Exception as e:
         print(f"Error during data processing for {table_name}: {e}")
@@ -33,12 +75,12 @@ def main():
         # Add other tables here as needed
     ]
 
-    for dataset in datasets:
-        table_name = dataset['table_name']
-        source_url = dataset['source_url']
-
-        # Fetch and process the data for each table
-        fetch_and_process_data(source_url, table_name)
+    # Fetch and process the data for each table in parallel (each dataset is I/O bound on its own URLs)
+    with ThreadPoolExecutor(max_workers=len(datasets)) as executor:
+        list(executor.map(
+            lambda dataset: fetch_and_process_data(dataset['source_url'], dataset['table_name']),
+            datasets,
+        ))
 
 if __name__ == '__main__':
     main()